@@ -28,6 +28,8 @@ from trading_calendars.calendar_utils import (
     global_calendar_dispatcher as default_calendar,
 )
 from datetime import timedelta
+from time import sleep
+import concurrent.futures
 import uuid
 
 from .base import BaseBackend
@@ -172,7 +174,6 @@ class Backend(BaseBackend):
                 conn.run()
                 log.info("Connection reestablished")
             except Exception:
-                from time import sleep
                 sleep(5)
                 asyncio.set_event_loop(asyncio.new_event_loop())
 
@@ -186,7 +187,10 @@ class Backend(BaseBackend):
 
     def get_equities(self):
         assets = []
+        seen_exchanges = set()
         t = normalize_date(pd.Timestamp('now', tz=NY))
+        start_date = t - one_day_offset
+        end_date = t + end_offset
         raw_assets = self._api.list_assets(asset_class='us_equity')
         for raw_asset in raw_assets:
 
@@ -196,10 +200,10 @@ class Backend(BaseBackend):
                 asset_name=raw_asset.symbol,
             )
 
-            asset.start_date = t - one_day_offset
+            asset.start_date = start_date
 
             if raw_asset.status == 'active' and raw_asset.tradable:
-                asset.end_date = t + end_offset
+                asset.end_date = end_date
             else:
                 # this is an experimental change, if an asset is not active or
                 # tradable, don't include it in the asset list. why?
@@ -216,16 +220,18 @@ class Backend(BaseBackend):
                 # so I do this with caution.
                 continue
                 # if asset is not tradable, set end_date = day before
-                asset.end_date = t - one_day_offset
+                asset.end_date = start_date
             asset.auto_close_date = asset.end_date
 
             assets.append(asset)
 
             # register all unseen exchange name as
             # alias of NYSE (e.g. AMEX, ARCA, NYSEARCA.)
-            if not default_calendar.has_calendar(raw_asset.exchange):
-                register_calendar_alias(raw_asset.exchange,
-                                        'NYSE', force=True)
+            if raw_asset.exchange not in seen_exchanges:
+                seen_exchanges.add(raw_asset.exchange)
+                if not default_calendar.has_calendar(raw_asset.exchange):
+                    register_calendar_alias(raw_asset.exchange,
+                                            'NYSE', force=True)
 
         return assets
 
@@ -238,14 +244,16 @@ class Backend(BaseBackend):
         for pos in positions:
             symbol = pos.symbol
             try:
-                z_position = zp.Position(symbol_lookup(symbol))
+                asset = symbol_lookup(symbol)
             except SymbolNotFound:
                 continue
-            z_position.amount = int(pos.qty)
-            z_position.cost_basis = float(pos.cost_basis) / float(pos.qty)
+            amount = int(pos.qty)
+            z_position = zp.Position(asset)
+            z_position.amount = amount
+            z_position.cost_basis = float(pos.cost_basis) / amount
             z_position.last_sale_price = None
             z_position.last_sale_date = None
-            z_positions[symbol_lookup(symbol)] = z_position
+            z_positions[asset] = z_position
             symbols.append(symbol)
             position_map[symbol] = z_position
 
@@ -262,10 +270,16 @@ class Backend(BaseBackend):
 
     @property
     def portfolio(self):
-        account = self._api.get_account()
+        # fetch the account in the background while positions are built.
+        # positions stay on this thread since symbol_lookup depends on the
+        # thread-local api context.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            account_task = executor.submit(self._api.get_account)
+            positions = self.positions
+            account = account_task.result()
         z_portfolio = zp.Portfolio()
         z_portfolio.cash = float(account.cash)
-        z_portfolio.positions = self.positions
+        z_portfolio.positions = positions
         z_portfolio.positions_value = float(
             account.portfolio_value) - float(account.cash)
         z_portfolio.portfolio_value = float(account.portfolio_value)
@@ -300,6 +314,17 @@ class Backend(BaseBackend):
             zp_order.filled = int(order.filled_qty)
         return zp_order
 
+    def _get_position_amount(self, symbol):
+        """
+        Return the currently held amount of symbol. Unlike the positions
+        property, this skips the symbol lookups and last trade requests
+        for every other holding.
+        """
+        for pos in self._api.list_positions():
+            if pos.symbol == symbol:
+                return int(pos.qty)
+        return 0
+
     def _new_order_id(self):
         return uuid.uuid4().hex
 
@@ -311,19 +336,19 @@ class Backend(BaseBackend):
         zp_order_id = self._new_order_id()
 
         if quantopian_compatible:
-            current_position = self.positions[asset]
+            current_amount = self._get_position_amount(symbol)
             if (
-                abs(amount) > abs(current_position.amount) and
-                amount * current_position.amount < 0
+                abs(amount) > abs(current_amount) and
+                amount * current_amount < 0
             ):
                 # The order would take us from a long position to a short
                 # position or vice versa and needs to be broken up
                 self._orders_pending_submission[zp_order_id] = (
                     asset,
-                    amount + current_position.amount,
+                    amount + current_amount,
                     style
                 )
-                amount = -1 * current_position.amount
+                amount = -1 * current_amount
 
         qty = amount if amount > 0 else -amount
 
@@ -473,32 +498,34 @@ class Backend(BaseBackend):
     def _get_spot_trade(self, symbols, field):
         assert(field in ('price', 'last_traded'))
         symbol_trades = self._get_symbols_last_trade_value(symbols)
+        trades = [symbol_trades.get(symbol) for symbol in symbols]
 
-        def get_for_symbol(symbol_trades, symbol):
-            trade = symbol_trades.get(symbol)
-            if field == 'price':
-                if trade is None:
-                    return np.nan
-                return trade.price
-            else:
-                if trade is None:
-                    return pd.NaT
-                return trade.timestamp
-
-        return [get_for_symbol(symbol_trades, symbol) for symbol in symbols]
+        if field == 'price':
+            return [np.nan if trade is None else trade.price
+                    for trade in trades]
+        return [pd.NaT if trade is None else trade.timestamp
+                for trade in trades]
 
     def _get_symbols_last_trade_value(self, symbols):
         """
-        Query last_trade in parallel for multiple symbols and
-        return in dict.
+        Query last_trade for multiple symbols, in batches of up to
+        ALPACA_MAX_SYMBOLS_PER_REQUEST symbols fetched in parallel, and
+        return in dict. Symbols without a trade map to None.
         symbols: list[str]
         """
 
         @skip_http_error((404, 504))
-        def fetch(symbol):
-            return self._api.get_latest_trade(symbol)
-
-        return parallelize(fetch)(symbols)
+        def fetch(part):
+            return self._api.get_latest_trades(part)
+
+        parts = [symbols[i:i + ALPACA_MAX_SYMBOLS_PER_REQUEST]
+                 for i in range(0, len(symbols),
+                                ALPACA_MAX_SYMBOLS_PER_REQUEST)]
+        trades = {symbol: None for symbol in symbols}
+        for part_trades in parallelize(fetch)(parts).values():
+            if part_trades:
+                trades.update(part_trades)
+        return trades
 
     def _get_spot_bars(self, symbols, field):
         symbol_bars = self._fetch_bars_from_api(symbols,
@@ -18,6 +18,31 @@ from pylivetrader.finance.order import (
 )
 
 
+_OPEN_ORDER = {
+    'asset_class': 'us_equity',
+    'asset_id': '93f58d0b-6c53-432d-b8ce-2bad264dbd94',
+    'canceled_at': None,
+    'client_order_id': 'my_id_open',
+    'created_at': '2018-08-29T13:31:02.779465Z',
+    'expired_at': None,
+    'failed_at': None,
+    'filled_at': None,
+    'filled_avg_price': None,
+    'filled_qty': '0',
+    'id': '6abca255-bc5a-4688-a547-4bfd2c33a979',
+    'limit_price': '1.3',
+    'order_type': 'limit',
+    'qty': '3846',
+    'side': 'buy',
+    'status': 'new',
+    'stop_price': None,
+    'submitted_at': '2018-08-29T13:31:02.779394Z',
+    'symbol': 'AAPL',
+    'time_in_force': 'day',
+    'type': 'limit',
+    'updated_at': '2018-08-30T19:59:00.737786Z'}
+
+
 def test_skip_http_error():
 
     @alpaca.skip_http_error((404, ))
@@ -35,6 +60,22 @@ def test_skip_http_error():
         internal_server_error()
 
 
+def test_get_symbols_last_trade_value():
+    backend = alpaca.Backend('key-id', 'secret-key')
+    symbols = ['SYM{}'.format(i)
+               for i in range(alpaca.ALPACA_MAX_SYMBOLS_PER_REQUEST + 1)]
+    with patch.object(backend, '_api') as _api:
+        _api.get_latest_trades.side_effect = lambda part: {
+            s: Mock(price=1.0) for s in part if s != 'SYM0'}
+        res = backend._get_symbols_last_trade_value(symbols)
+
+    # one request per batch of symbols
+    assert _api.get_latest_trades.call_count == 2
+    assert len(res) == len(symbols)
+    assert res['SYM0'] is None
+    assert res[symbols[-1]].price == 1.0
+
+
 def test_orders():
     backend = alpaca.Backend('key-id', 'secret-key')
     with patch.object(backend, '_api') as _api:
@@ -107,75 +148,16 @@ def test_orders():
             assert len(res.positions) == 1
 
             _api.list_orders.return_value = [
+                Order(_OPEN_ORDER),
                 Order({
-                    'asset_class': 'us_equity',
-                    'asset_id': '93f58d0b-6c53-432d-b8ce-2bad264dbd94',
-                    'canceled_at': None,
-                    'client_order_id': 'my_id_open',
-                    'created_at': '2018-08-29T13:31:02.779465Z',
-                    'expired_at': None,
-                    'failed_at': None,
-                    'filled_at': None,
-                    'filled_avg_price': None,
-                    'filled_qty': '0',
-                    'id': '6abca255-bc5a-4688-a547-4bfd2c33a979',
-                    'limit_price': '1.3',
-                    'order_type': 'limit',
-                    'qty': '3846',
-                    'side': 'buy',
-                    'status': 'new',
-                    'stop_price': None,
-                    'submitted_at': '2018-08-29T13:31:02.779394Z',
-                    'symbol': 'AAPL',
-                    'time_in_force': 'day',
-                    'type': 'limit',
-                    'updated_at': '2018-08-30T19:59:00.737786Z'}),
-                Order({
-                    'asset_class': 'us_equity',
-                    'asset_id': '93f58d0b-6c53-432d-b8ce-2bad264dbd94',
-                    'canceled_at': None,
+                    **_OPEN_ORDER,
                     'client_order_id': 'my_id_failed',
-                    'created_at': '2018-08-29T13:31:02.779465Z',
-                    'expired_at': None,
-                    'failed_at': '2018-08-29T13:31:02.779465Z',
-                    'filled_at': None,
-                    'filled_avg_price': None,
-                    'filled_qty': '0',
-                    'id': '6abca255-bc5a-4688-a547-4bfd2c33a979',
-                    'limit_price': '1.3',
-                    'order_type': 'limit',
-                    'qty': '3846',
-                    'side': 'buy',
-                    'status': 'new',
-                    'stop_price': None,
-                    'submitted_at': '2018-08-29T13:31:02.779394Z',
-                    'symbol': 'AAPL',
-                    'time_in_force': 'day',
-                    'type': 'limit',
-                    'updated_at': '2018-08-30T19:59:00.737786Z'}),
+                    'failed_at': '2018-08-29T13:31:02.779465Z'}),
                 Order({
-                    'asset_class': 'us_equity',
-                    'asset_id': '93f58d0b-6c53-432d-b8ce-2bad264dbd94',
-                    'canceled_at': None,
+                    **_OPEN_ORDER,
                     'client_order_id': 'my_id_filled',
-                    'created_at': '2018-08-29T13:31:02.779465Z',
-                    'expired_at': None,
-                    'failed_at': None,
                     'filled_at': '2018-08-29T13:31:02.779465Z',
-                    'filled_avg_price': '200',
-                    'filled_qty': '0',
-                    'id': '6abca255-bc5a-4688-a547-4bfd2c33a979',
-                    'limit_price': '1.3',
-                    'order_type': 'limit',
-                    'qty': '3846',
-                    'side': 'buy',
-                    'status': 'new',
-                    'stop_price': None,
-                    'submitted_at': '2018-08-29T13:31:02.779394Z',
-                    'symbol': 'AAPL',
-                    'time_in_force': 'day',
-                    'type': 'limit',
-                    'updated_at': '2018-08-30T19:59:00.737786Z'}),
+                    'filled_avg_price': '200'}),
             ]
             res = backend.orders
             # make sure order status is set correctly
@@ -184,27 +166,13 @@ def test_orders():
             assert res['my_id_filled']._status == ZP_ORDER_STATUS.FILLED
 
             _api.submit_order.return_value = Order({
-                'asset_class': 'us_equity',
-                'asset_id': '93f58d0b-6c53-432d-b8ce-2bad264dbd94',
-                'canceled_at': None,
+                **_OPEN_ORDER,
                 'client_order_id': '439dca01703b4674a61a72713a612d24',
                 'created_at': '2018-08-29T13:31:01.710698Z',
-                'expired_at': None,
-                'failed_at': None,
-                'filled_at': None,
-                'filled_avg_price': None,
-                'filled_qty': '0',
                 'id': '2c366657-fdbd-4554-a14d-b19df2bf430c',
                 'limit_price': '2.05',
-                'order_type': 'limit',
                 'qty': '1',
-                'side': 'buy',
-                'status': 'new',
-                'stop_price': None,
                 'submitted_at': '2018-08-29T13:31:01.710651Z',
-                'symbol': 'AAPL',
-                'time_in_force': 'day',
-                'type': 'limit',
                 'updated_at': '2018-08-30T19:59:00.553942Z'})
 
             aapl = algo.symbol('AAPL')
@@ -218,6 +186,11 @@ def test_orders():
                 aapl, 1, StopLimitOrder(
                     limit_price=100, stop_price=200))
 
+            # flipping a long position to short is split into two orders
+            backend.order(aapl, -3, MarketOrder())
+            pending = list(backend._orders_pending_submission.values())
+            assert pending[-1][1] == -2
+
             backend.cancel_order('some-id')
 
             # order submission fail